@@ -3,13 +3,34 @@ this file contains all functions required in computing
 new infections, recoveries, and deaths
 '''
 
+from functools import lru_cache
+
 import numpy as np
 
 from motion import get_motion_parameters
 
+#random generator used for all dice rolls in this file, use set_seed to seed it
+_rng = np.random.default_rng()
+
+#maximum number of grid cells find_neighbours keeps a lookup table for
+MAX_CELL_TABLE_SIZE = 2 ** 20
+
+def set_seed(seed):
+    '''seeds the random generator used for infections, recoveries and deaths
+
+    Keyword arguments
+    -----------------
+    seed : int or None
+        the seed for the random generator, None for a fresh random seed
+    '''
+
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
 def infect(population, pop_size, infection_range, infection_chance, frame, 
            healthcare_capacity, verbose, send_to_location=False,
-           location_bounds=[], destinations=[], location_no=1, location_odds=1.0,
+           location_bounds=[], destinations=None, location_no=1, location_odds=1.0,
            traveling_infects=False):
     '''finds new infections.
     
@@ -46,9 +67,9 @@ def infect(population, pop_size, infection_range, infection_chance, frame,
         the location bounds where the infected person is sent to and can roam
         within (xmin, ymin, xmax, ymax)
 
-    destinations : list or ndarray
+    destinations : ndarray or None
         the destinations vector containing destinations for each individual in the population.
-        Needs to be of same length as population
+        Needs to be of same length as population. Only required if send_to_location is set
 
     location_no : int
         the location number, used as index for destinations array if multiple possible
@@ -60,102 +81,154 @@ def infect(population, pop_size, infection_range, infection_chance, frame,
 
     traveling_infects : bool
         whether infected people heading to a destination can still infect others on the way there
+
+    returns population, destinations : ndarray
+        the updated population and destinations, the latter is passed through
+        unchanged (may be None) if send_to_location is not set
     '''
 
     #find new infections
-    infected_previous_step = population[population[:,6] == 1]
+    infected_idx = np.flatnonzero(population[:,6] == 1)
+    healthy_idx = np.flatnonzero(population[:,6] == 0)
 
-    new_infections = []
+    #only patients not on their way to a destination infect others, unless traveling_infects
+    if traveling_infects:
+        infectious_idx = infected_idx
+    else:
+        infectious_idx = infected_idx[population[:,11][infected_idx] == 0]
 
     #if less than half are infected, slice based on infected (to speed up computation)
-    if len(infected_previous_step) < (pop_size // 2):
-        for patient in infected_previous_step:
-            #define infection zone for patient
-            infection_zone = [patient[1] - infection_range, patient[2] - infection_range,
-                              patient[1] + infection_range, patient[2] + infection_range]
-
-            #find healthy people surrounding infected patient
-            if traveling_infects or patient[11] == 0:
-                indices = np.int32(population[:,0][(infection_zone[0] < population[:,1]) & 
-                                                   (population[:,1] < infection_zone[2]) &
-                                                   (infection_zone[1] < population [:,2]) & 
-                                                   (population[:,2] < infection_zone[3]) &
-                                                   (population[:,6] == 0)])
-            else:
-                indices = []
-
-            for idx in indices:
-                #roll die to see if healthy person will be infected
-                if np.random.random() < infection_chance:
-                    population[idx][6] = 1
-                    population[idx][8] = frame
-                    if len(population[population[:,10] == 1]) <= healthcare_capacity:
-                        population[idx][10] = 1
-                        if send_to_location:
-                            #send to location if die roll is positive
-                            if np.random.uniform() <= location_odds:
-                                population[idx],\
-                                destinations[idx] = go_to_location(population[idx],
-                                                                   destinations[idx],
-                                                                   location_bounds, 
-                                                                   dest_no=location_no)
-                        else:
-                            pass
-                    new_infections.append(idx)
+    if len(infected_idx) < (pop_size // 2):
+        #find healthy people surrounding infected patients
+        _, neighbours = find_neighbours(population[healthy_idx, 1:3],
+                                        population[infectious_idx, 1:3],
+                                        infection_range)
+        #roll die for each patient nearby to see if healthy person will be infected
+        candidates = healthy_idx[neighbours]
+        infection_odds = infection_chance
 
     else:
         #if more than half are infected slice based in healthy people (to speed up computation)
-        healthy_previous_step = population[population[:,6] == 0]
-        sick_previous_step = population[population[:,6] == 1]
-        
-        
-        for person in healthy_previous_step:
-            #define infecftion range around healthy person
-            infection_zone = [person[1] - infection_range, person[2] - infection_range,
-                              person[1] + infection_range, person[2] + infection_range]
-
-            if person[6] == 0: #if person is not already infected, find if infected are nearby
-                #find infected nearby healthy person
-                if traveling_infects:
-                    poplen = len(sick_previous_step[:,6][(infection_zone[0] < sick_previous_step[:,1]) & 
-                                 (sick_previous_step[:,1] < infection_zone[2]) &
-                                 (infection_zone[1] < sick_previous_step [:,2]) & 
-                                 (sick_previous_step[:,2] < infection_zone[3]) &
-                                 (sick_previous_step[:,6] == 1)])
-                else:
-                    poplen = len(sick_previous_step[:,6][(infection_zone[0] < sick_previous_step[:,1]) & 
-                                 (sick_previous_step[:,1] < infection_zone[2]) &
-                                 (infection_zone[1] < sick_previous_step [:,2]) & 
-                                 (sick_previous_step[:,2] < infection_zone[3]) &
-                                 (sick_previous_step[:,6] == 1) &
-                                 (sick_previous_step[:,11] == 0)])
-                
-                if poplen > 0:
-                    if np.random.random() < (infection_chance * poplen):
-                        #roll die to see if healthy person will be infected
-                        population[np.int32(person[0])][6] = 1
-                        population[np.int32(person[0])][8] = frame
-                        if len(population[population[:,10] == 1]) <= healthcare_capacity:
-                            population[np.int32(person[0])][10] = 1
-                            if send_to_location:
-                                #send to location and add to treatment if die roll is positive
-                                if np.random.uniform() < location_odds:
-                                    population[np.int32(person[0])],\
-                                    destinations[np.int32(person[0])] = go_to_location(population[np.int32(person[0])],
-                                                                                       destinations[np.int32(person[0])],
-                                                                                       location_bounds, 
-                                                                                       dest_no=location_no)
-
-
-                        new_infections.append(np.int32(person[0]))
+        #count infected nearby each healthy person
+        nearby, _ = find_neighbours(population[infectious_idx, 1:3],
+                                    population[healthy_idx, 1:3],
+                                    infection_range)
+        poplens = np.bincount(nearby, minlength=len(healthy_idx))
+        exposed = np.flatnonzero(poplens)
+        #roll die once for each healthy person with infected nearby
+        candidates = healthy_idx[exposed]
+        infection_odds = infection_chance * poplens[exposed]
+
+    #find how many new infections can go into treatment, admitting
+    #while the count is at most healthcare_capacity
+    n_in_treatment = np.count_nonzero(population[:,10] == 1)
+    treatment_space = max(0, healthcare_capacity - n_in_treatment + 1)
+
+    #draw all dice for this step at once: one infection die per candidate, followed
+    #by location dice for at most as many people as can go into treatment
+    n_location_rolls = min(len(candidates), treatment_space) if send_to_location else 0
+    rolls = _rng.random(len(candidates) + n_location_rolls)
+
+    #mark everyone with a positive die roll, so that those infected by more
+    #than one patient are counted once without having to sort
+    infected = np.zeros((len(population),), dtype=bool)
+    infected[candidates[rolls[:len(candidates)] < infection_odds]] = True
+    new_infections = np.flatnonzero(infected)
+    population[:,6][new_infections] = 1
+    population[:,8][new_infections] = frame
+
+    #put new infections in treatment while there is healthcare capacity left
+    in_treatment = new_infections[:treatment_space]
+    population[:,10][in_treatment] = 1
+
+    if send_to_location:
+        #send to location if die roll is positive
+        location_rolls = rolls[len(candidates):len(candidates) + len(in_treatment)]
+        to_location = in_treatment[location_rolls <= location_odds]
+        population, destinations = go_to_location_batch(population, destinations,
+                                                        to_location, location_bounds,
+                                                        dest_no=location_no)
 
     if len(new_infections) > 0 and verbose:
-        print('at timestep %i these people got sick: %s' %(frame, new_infections))
+        print('at timestep %i these people got sick: %s' %(frame, new_infections.tolist()))
+
+    return population, destinations
+
+
+def find_neighbours(points, queries, search_range):
+    '''finds all points within range of a set of query points
 
-    if len(destinations) == 0:
-        return population
+    Function that bins the points into a grid of square cells with sides of
+    search_range, so that for each query point only the 3x3 block of cells
+    around it needs to be searched in stead of the whole population. The
+    start of each cell in the sorted points is kept in a lookup table, so
+    the cells are found without searching. If the grid has more cells than
+    MAX_CELL_TABLE_SIZE (and than 4 times the number of points), the cells
+    are found by bisection over the occupied cells in stead, so memory use
+    does not grow with the number of cells. A point is in range when it lies
+    within the square of search_range around the query point, matching the
+    infection zone used elsewhere.
+
+    Keyword arguments
+    -----------------
+    points : ndarray
+        2d array of the (x, y) coordinates to search in
+
+    queries : ndarray
+        2d array of the (x, y) coordinates to search around
+
+    search_range : float
+        half the side of the square around each query point
+
+    returns query_idx, point_idx : ndarray
+        index pairs, one for each point in range of a query point
+    '''
+
+    if len(points) == 0 or len(queries) == 0 or not search_range > 0:
+        return np.zeros((0,), dtype=np.int64), np.zeros((0,), dtype=np.int64)
+
+    #find grid cells, offset so that all neighbouring cells are non-negative
+    point_cells = np.int64(np.floor(points / search_range))
+    query_cells = np.int64(np.floor(queries / search_range))
+    lower = np.minimum(point_cells.min(axis=0), query_cells.min(axis=0)) - 1
+    point_cells -= lower
+    query_cells -= lower
+    height = max(point_cells[:,0].max(), query_cells[:,0].max()) + 2
+    width = max(point_cells[:,1].max(), query_cells[:,1].max()) + 2
+    n_cells = int(height) * int(width)
+
+    #sort points by cell so each cell is a contiguous run
+    point_keys = point_cells[:,0] * width + point_cells[:,1]
+    order = np.argsort(point_keys, kind='stable')
+
+    #find runs of the 3x3 cells around each query point
+    offsets = np.array([-1, 0, 1])
+    neighbour_keys = ((query_cells[:,0,None,None] + offsets[None,:,None]) * width +
+                      (query_cells[:,1,None,None] + offsets[None,None,:])).ravel()
+
+    if n_cells <= max(MAX_CELL_TABLE_SIZE, 4 * len(points)):
+        #find where each cell's run starts from the number of points in the cells before it
+        cell_starts = np.zeros((n_cells + 1,), dtype=np.int64)
+        np.cumsum(np.bincount(point_keys, minlength=n_cells), out=cell_starts[1:])
+        starts = cell_starts[neighbour_keys]
+        counts = cell_starts[neighbour_keys + 1] - starts
     else:
-        return population, destinations
+        #grid too large for a table of all cells, search the occupied cells only
+        sorted_keys = point_keys[order]
+        starts = np.searchsorted(sorted_keys, neighbour_keys, side='left')
+        counts = np.searchsorted(sorted_keys, neighbour_keys, side='right') - starts
+
+    #expand runs into candidate pairs
+    query_idx = np.repeat(np.arange(len(queries)), 9)
+    query_idx = np.repeat(query_idx, counts)
+    run_offsets = np.cumsum(counts) - counts
+    point_idx = order[np.repeat(starts - run_offsets, counts) + np.arange(counts.sum())]
+
+    #keep only those within the square range
+    in_range = ((np.abs(points[point_idx,0] - queries[query_idx,0]) < search_range) &
+                (np.abs(points[point_idx,1] - queries[query_idx,1]) < search_range))
+
+    return query_idx[in_range], point_idx[in_range]
 
 
 def recover_or_die(population, frame, recovery_duration, mortality_chance, 
@@ -209,58 +282,49 @@ def recover_or_die(population, frame, recovery_duration, mortality_chance,
     '''
 
     #find sick people
-    sick_people = population[population[:,6] == 1]
-
-    #define vector of how long everyone has been sick
-    illness_duration_vector = frame - sick_people[:,8]
-    
-    recovery_odds_vector = (illness_duration_vector - recovery_duration[0]) / np.ptp(recovery_duration)
-    recovery_odds_vector = np.clip(recovery_odds_vector, a_min = 0, a_max = None)
-
-    #update states of sick people 
-    indices = sick_people[:,0][recovery_odds_vector >= sick_people[:,9]]
+    sick_idx = np.flatnonzero(population[:,6] == 1)
+
+    #define vector of how far everyone is into the recovery duration,
+    #computed in place in a single buffer
+    recovery_odds_vector = population[:,8][sick_idx]
+    np.subtract(frame - recovery_duration[0], recovery_odds_vector, out=recovery_odds_vector)
+    recovery_odds_vector *= 1.0 / (recovery_duration[1] - recovery_duration[0])
+    np.maximum(recovery_odds_vector, 0, out=recovery_odds_vector)
+
+    #find sick people that are ready to recover or die
+    idx_rows = sick_idx[recovery_odds_vector >= population[:,9][sick_idx]]
+
+    #check if we want risk to be age dependent
+    if age_dependent_risk:
+        updated_mortality_chance = compute_mortality(population[:,7][idx_rows], mortality_chance,
+                                                     risk_age, critical_age,
+                                                     critical_mortality_chance,
+                                                     risk_increase)
+    else:
+        updated_mortality_chance = np.full(len(idx_rows), mortality_chance)
 
-    cured = []
-    died = []
+    if treatment_dependent_risk:
+        #if person is not in treatment, increase risk by no_treatment_factor
+        #if person is in treatment, decrease risk by treatment_factor
+        updated_mortality_chance = updated_mortality_chance * np.where(population[:,10][idx_rows] == 0,
+                                                                       no_treatment_factor,
+                                                                       treatment_factor)
 
     #decide whether to die or recover
-    for idx in indices:
-        #check if we want risk to be age dependent
-        #if age_dependent_risk:
-        if age_dependent_risk:
-            updated_mortality_chance = compute_mortality(sick_people[sick_people[:,0] == idx][:,7][0], 
-                                                         mortality_chance,
-                                                         risk_age, critical_age, 
-                                                         critical_mortality_chance, 
-                                                         risk_increase)
-        else:
-            updated_mortality_chance = mortality_chance
-
-        if sick_people[sick_people[:,0] == int(idx)][:,10] == 0 and treatment_dependent_risk:
-            #if person is not in treatment, increase risk by no_treatment_factor
-            updated_mortality_chance = updated_mortality_chance * no_treatment_factor
-        elif sick_people[sick_people[:,0] == int(idx)][:,10] == 1 and treatment_dependent_risk:
-            #if person is in treatment, decrease risk by 
-            updated_mortality_chance = updated_mortality_chance * treatment_factor
-
-        if np.random.random() <= updated_mortality_chance:
-            #die
-            sick_people[:,6][sick_people[:,0] == idx] = 3
-            sick_people[:,10][sick_people[:,0] == idx] = 0
-            died.append(np.int32(sick_people[sick_people[:,0] == idx][:,0][0]))
-        else:
-            #recover (become immune)
-            sick_people[:,6][sick_people[:,0] == idx] = 2
-            sick_people[:,10][sick_people[:,0] == idx] = 0
-            cured.append(np.int32(sick_people[sick_people[:,0] == idx][:,0][0]))
+    died_mask = _rng.random(len(idx_rows)) <= updated_mortality_chance
+    died = idx_rows[died_mask]
+    cured = idx_rows[~died_mask]
+
+    #die
+    population[:,6][died] = 3
+    #recover (become immune)
+    population[:,6][cured] = 2
+    population[:,10][idx_rows] = 0
 
     if len(died) > 0 and verbose:
-        print('at timestep %i these people died: %s' %(frame, died))
+        print('at timestep %i these people died: %s' %(frame, died.tolist()))
     if len(cured) > 0 and verbose:
-        print('at timestep %i these people recovered: %s' %(frame, cured))
-
-    #put array back into population
-    population[population[:,6] == 1] = sick_people
+        print('at timestep %i these people recovered: %s' %(frame, cured.tolist()))
 
     return population
 
@@ -277,10 +341,13 @@ def compute_mortality(age, mortality_chance, risk_age=50,
 
     Whether risk increases linearly or quadratic is settable.
 
+    The risk for every age up to the critical age is computed once per set
+    of parameters and looked up, so ages can be passed as an array.
+
     Keyword arguments
     -----------------
-    age : int
-        the age of the person
+    age : int or ndarray
+        the age of the person, or an array of ages
 
     mortality_chance : float
         the base mortality chance
@@ -301,37 +368,60 @@ def compute_mortality(age, mortality_chance, risk_age=50,
         and the critical age increases linearly or exponentially
     '''
 
-    if risk_age < age < critical_age: # if age in range
-        if risk_increase == 'linear':
-            #find linear risk
-            step_increase = (critical_mortality_chance) / ((critical_age - risk_age) + 1)
-            risk = critical_mortality_chance - ((critical_age - age) * step_increase)
-            return risk
-        elif risk_increase == 'quadratic':
-            #define exponential function between risk_age and critical_age
-            pw = 15
-            A = np.exp(np.log(mortality_chance / critical_mortality_chance)/pw)
-            a = ((risk_age - 1) - critical_age * A) / (A - 1)
-            b = mortality_chance / ((risk_age -1) + a ) ** pw
-
-            #define linespace
-            x = np.linspace(0, critical_age, critical_age)
-            #find values
-            risk_values = ((x + a) ** pw) * b
-            return risk_values[np.int32(age- 1)]
-    elif age <= risk_age:
-        #simply return the base mortality chance
-        return mortality_chance
-    elif age >= critical_age:
-        #simply return the maximum mortality chance
-        return critical_mortality_chance
-
-
-def healthcare_infection_correction(worker_population, healthcare_risk_factor=0.2):
+    risk_table = _mortality_table(mortality_chance, risk_age, critical_age,
+                                  critical_mortality_chance, risk_increase)
+
+    return risk_table[np.clip(np.int32(age), 0, len(risk_table) - 1)]
+
+
+@lru_cache(maxsize=16)
+def _mortality_table(mortality_chance, risk_age, critical_age,
+                     critical_mortality_chance, risk_increase):
+    '''computes the mortality risk for all ages up to the critical age
+
+    returns a read-only array of length critical_age + 1, indexed by age.
+    See compute_mortality for the arguments.
+    '''
+
+    ages = np.arange(int(critical_age) + 1)
+    in_range = (risk_age < ages) & (ages < critical_age)
+
+    if risk_increase == 'linear':
+        #find linear risk
+        step_increase = (critical_mortality_chance) / ((critical_age - risk_age) + 1)
+        risk_values = critical_mortality_chance - ((critical_age - ages) * step_increase)
+    elif risk_increase == 'quadratic':
+        #define exponential function between risk_age and critical_age
+        pw = 15
+        A = np.exp(np.log(mortality_chance / critical_mortality_chance)/pw)
+        a = ((risk_age - 1) - critical_age * A) / (A - 1)
+        b = mortality_chance / ((risk_age -1) + a ) ** pw
+
+        #define linespace
+        x = np.linspace(0, critical_age, critical_age)
+        #find values, shifted by one so they are indexed by age
+        risk_values = np.zeros(ages.shape)
+        risk_values[1:] = ((x + a) ** pw) * b
+    else:
+        raise ValueError('risk_increase should be \'linear\' or \'quadratic\', got %s' %risk_increase)
+
+    #base mortality chance up to risk age, maximum from critical age on
+    risk_table = np.where(ages <= risk_age, mortality_chance, critical_mortality_chance)
+    risk_table[in_range] = risk_values[in_range]
+
+    #the same array is handed out on every call, so guard it against changes
+    risk_table.flags.writeable = False
+
+    return risk_table
+
+
+def healthcare_infection_correction(worker_population, frame, healthcare_risk_factor=0.2):
     '''corrects infection to healthcare population.
 
-    Takes the healthcare risk factor and adjusts the sick healthcare workers
-    by reducing (if < 0) ir increasing (if > 0) sick healthcare workers
+    Takes the healthcare risk factor and adjusts the healthcare workers that
+    got sick in the current timestep by reducing (if < 0) ir increasing (if > 0)
+    sick healthcare workers. Needs to be called right after infect, in the
+    same timestep.
 
     Keyword arguments
     -----------------
@@ -339,6 +429,9 @@ def healthcare_infection_correction(worker_population, healthcare_risk_factor=0.
         the array containing all variables related to the healthcare population.
         Is a subset of the 'population' matrix.
 
+    frame : int
+        the current timestep of the simulation
+
     healthcare_risk_factor : int or float
         if other than one, defines the change in odds of contracting an infection.
         Can be used to simulate healthcare personell having extra protections in place (< 1)
@@ -346,10 +439,18 @@ def healthcare_infection_correction(worker_population, healthcare_risk_factor=0.
     '''
 
     if healthcare_risk_factor < 0:
-        #set 1 - healthcare_risk_factor workers to non sick
-        sick_workers = worker_population[:,6][worker_population[:,6] == 1]
-        cure_vector = np.random.uniform((len(sick_workers)))
-        sick_workers[:,6][cure_vector >= healthcare_risk_factor] = 0
+        #set 1 - healthcare_risk_factor of newly infected workers to non sick
+        sick_idx = np.flatnonzero((worker_population[:,6] == 1) &
+                                  (worker_population[:,8] == frame))
+        cure_vector = _rng.random(len(sick_idx))
+        cured = sick_idx[cure_vector >= abs(healthcare_risk_factor)]
+        worker_population[:,6][cured] = 0
+        worker_population[:,8][cured] = 0
+        #undo the treatment infect gave them this timestep, as well as the trip
+        #to the hospital, where simulation_hospital sends everyone in treatment
+        treated = cured[worker_population[:,10][cured] == 1]
+        worker_population[:,10][treated] = 0
+        worker_population[:,11][treated] = 0
     elif healthcare_risk_factor > 0:
         #TODO: make proportion of extra workers sick
         pass
@@ -360,43 +461,56 @@ def healthcare_infection_correction(worker_population, healthcare_risk_factor=0.
 
 
 
-def go_to_location(patient, destination, location_bounds, dest_no=1):
-    '''sends patient to defined location
+def go_to_location_batch(population, destinations, idx, location_bounds, dest_no=1):
+    '''sends patients to defined location
 
-    Function that takes a patient an destination, and sets the location
-    as active for that patient.
+    Function that takes the population and destinations, and sets the location
+    as active for the patients in idx.
 
     Keyword arguments
     -----------------
-    patient : 1d array
-        1d array of the patient data, is a row from population matrix
+    population : ndarray
+        the array containing all the population information
 
-    destination : 1d array
-        1d array of the destination data, is a row from destination matrix
+    destinations : ndarray
+        the array containing all destinations information
+
+    idx : ndarray
+        the row indices of the patients to send to the location
 
     location_bounds : list or tuple
-        defines bounds for the location the patient will be roam in when sent
+        defines bounds for the location the patients will be roam in when sent
         there. format: [xmin, ymin, xmax, ymax]
 
     dest_no : int
         the location number, used as index for destinations array if multiple possible
         destinations are defined`.
+    '''
+
+    x_center, y_center, x_wander, y_wander = _location_motion_parameters(tuple(location_bounds))
+    population[:,13][idx] = x_wander
+    population[:,14][idx] = y_wander
+    
+    destinations[:,(dest_no - 1) * 2][idx] = x_center
+    destinations[:,((dest_no - 1) * 2) + 1][idx] = y_center
 
+    population[:,11][idx] = dest_no #set destination active
 
-    TODO: vectorize
+    return population, destinations
 
-    '''
 
-    x_center, y_center, x_wander, y_wander = get_motion_parameters(location_bounds[0],
-                                                                   location_bounds[1],
-                                                                   location_bounds[2],
-                                                                   location_bounds[3])
-    patient[13] = x_wander
-    patient[14] = y_wander
-    
-    destination[(dest_no - 1) * 2] = x_center
-    destination[((dest_no - 1) * 2) + 1] = y_center
+@lru_cache(maxsize=16)
+def _location_motion_parameters(location_bounds):
+    '''gets destination center and wander ranges of a location
+
+    Cached version of motion.get_motion_parameters, as the location bounds
+    stay the same for a whole simulation run.
 
-    patient[11] = dest_no #set destination active
+    Keyword arguments
+    -----------------
+    location_bounds : tuple
+        the bounds of the location. format: (xmin, ymin, xmax, ymax)
+    '''
 
-    return patient, destination
\ No newline at end of file
+    return get_motion_parameters(location_bounds[0], location_bounds[1],
+                                 location_bounds[2], location_bounds[3])
@@ -268,8 +268,6 @@ def keep_at_destination(population, destinations, wander_factor=1):
         arrived = population[(population[:,12] == 1) &
                              (population[:,11] == d)]
 
-        ids = np.int32(arrived[:,0]) # find unique IDs of arrived persons
-        
         #check if there are those out of bounds
         #replace x oob
         #where x larger than destination + wander, AND heading wrong way, set heading negative
@@ -7,7 +7,7 @@ from matplotlib.animation import FuncAnimation
 from infection import infect, recover_or_die, compute_mortality
 from motion import update_positions, out_of_bounds, update_randoms,\
 set_destination, check_at_destination, keep_at_destination
-from population import initialize_population, initialize_destination_matrix
+from population import initialize_population, initialize_destination_matrix, get_state_counts
 
 
 def update(frame, population, destinations, pop_size, infection_range=0.01, 
@@ -270,9 +270,9 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
     population = update_positions(population)
     
     #find new infections
-    population = infect(population, pop_size, infection_range, infection_chance, frame, 
-                        healthcare_capacity, verbose)
-    infected_plot.append(len(population[population[:,6] == 1]))
+    population, destinations = infect(population, pop_size, infection_range, infection_chance, frame, 
+                                      healthcare_capacity, verbose, destinations = destinations)
+    infected_plot.append(get_state_counts(population)[1])
 
     #recover and die
     population = recover_or_die(population, frame, recovery_duration, mortality_chance,
@@ -280,7 +280,7 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
                                 risk_increase, no_treatment_factor, age_dependent_risk,
                                 treatment_dependent_risk, treatment_factor, verbose)
 
-    fatalities_plot.append(len(population[population[:,6] == 3]))
+    fatalities_plot.append(get_state_counts(population)[3])
 
     if visualise:
         #construct plot and visualise
@@ -33,6 +33,13 @@ def initialize_population(pop_size, mean_age=45, max_age=105,
     13 : wander_range_x : wander ranges on x axis for those who are confined to a location
     14 : wander_range_y : wander ranges on y axis for those who are confined to a location
 
+    The matrix is stored column-major (Fortran order), so that each of the
+    columns above is contiguous in memory. Nearly all computations select
+    on or update single columns, which then read only that column's data.
+    It is stored as float32, which halves the memory read by those column
+    scans and still holds the integer columns (IDs, states, ages, frames)
+    exactly for populations and simulation lengths up to 2**24.
+
     Keyword arguments
     -----------------
     pop_size : int
@@ -52,7 +59,7 @@ def initialize_population(pop_size, mean_age=45, max_age=105,
     '''
 
     #initialize population matrix
-    population = np.zeros((pop_size, 15))
+    population = np.zeros((pop_size, 15), dtype=np.float32, order='F')
 
     #initalize unique IDs
     population[:,0] = [x for x in range(pop_size)]
@@ -91,7 +98,8 @@ def initialize_destination_matrix(pop_size, total_destinations):
     '''intializes the destination matrix
 
     function that initializes the destination matrix used to
-    define individual location and roam zones for population members
+    define individual location and roam zones for population members.
+    Like the population matrix, it is stored column-major as float32.
 
     Keyword arguments
     -----------------
@@ -103,7 +111,7 @@ def initialize_destination_matrix(pop_size, total_destinations):
         one if for example people can go to work, supermarket, home, etc.
     '''
 
-    destinations = np.zeros((pop_size, total_destinations * 2))
+    destinations = np.zeros((pop_size, total_destinations * 2), dtype=np.float32, order='F')
 
     return destinations
 
@@ -156,6 +164,25 @@ def set_destination_bounds(population, destinations, xmin, ymin, xmax, ymax,
 
     return population, destinations
 
+def get_state_counts(population):
+    '''counts the population members in each state
+
+    Function that counts how many people are healthy, sick, immune and dead
+    in a single pass over the state column, in stead of selecting the
+    population members in each state separately.
+
+    Keyword arguments
+    -----------------
+    population : ndarray
+        the array containing all the population information
+
+    returns : ndarray
+        array of length 4 with the number of healthy, sick, immune and dead
+    '''
+
+    return np.bincount(np.int32(population[:,6]), minlength=4)
+
+
 def save_data(population, infected, fatalities):
     '''dumps simulation data to disk
 
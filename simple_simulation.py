@@ -183,47 +183,51 @@ def infect(population, infection_range, infection_chance, frame):
 
     #if less than half are infected, slice based on infected (to speed up computation)
     if len(infected_previous_step) < (pop_size // 2):
+        #sort population on x coordinate, so the people within range of a patient
+        #on the x axis are a contiguous window that can be found by bisection
+        order = np.argsort(population[:,1])
+        xs = population[:,1][order]
+        ys = population[:,2][order]
+
         for patient in infected_previous_step:
-            #define infection zone for patient
-            infection_zone = [patient[1] - infection_range, patient[2] - infection_range,
-                              patient[1] + infection_range, patient[2] + infection_range]
+            #find window of people within infection range on x axis
+            lo = np.searchsorted(xs, patient[1] - infection_range, side='right')
+            hi = np.searchsorted(xs, patient[1] + infection_range, side='left')
 
             #find healthy people surrounding infected patient
-            indices = np.int32(population[:,0][(infection_zone[0] < population[:,1]) & 
-                                               (population[:,1] < infection_zone[2]) &
-                                               (infection_zone[1] < population [:,2]) & 
-                                               (population[:,2] < infection_zone[3]) &
-                                               (population[:,6] == 0)])
-            for idx in indices:
-                #roll die to see if healthy person will be infected
-                if np.random.random() < infection_chance:
-                    population[idx][6] = 1
-                    population[idx][8] = frame
-                    new_infections.append(idx)
+            indices = order[lo:hi][(np.abs(ys[lo:hi] - patient[2]) < infection_range) &
+                                   (population[:,6][order[lo:hi]] == 0)]
+            #roll die to see if healthy people will be infected
+            infected = indices[np.random.random(len(indices)) < infection_chance]
+            population[:,6][infected] = 1
+            population[:,8][infected] = frame
+            new_infections.extend(infected.tolist())
 
     else:
         #if more than half are infected slice based in healthy people (to speed up computation)
-        healthy_previous_step = population[population[:,6] == 0]
+        healthy_idx = np.flatnonzero(population[:,6] == 0)
         sick_previous_step = population[population[:,6] == 1]
-        for person in healthy_previous_step:
-            #define infecftion range around healthy person
-            infection_zone = [person[1] - infection_range, person[2] - infection_range,
-                              person[1] + infection_range, person[2] + infection_range]
-
-            if person[6] == 0: #if person is not already infected, find if infected are nearby
-                #find infected nearby healthy person
-                poplen = len(sick_previous_step[:,6][(infection_zone[0] < sick_previous_step[:,1]) & 
-                                              (sick_previous_step[:,1] < infection_zone[2]) &
-                                              (infection_zone[1] < sick_previous_step [:,2]) & 
-                                              (sick_previous_step[:,2] < infection_zone[3]) &
-                                              (sick_previous_step[:,6] == 1)])
-
-                if poplen > 0:
-                    if np.random.random() < (infection_chance * poplen):
-                        #roll die to see if healthy person will be infected
-                        population[np.int32(person[0])][6] = 1
-                        population[np.int32(person[0])][8] = frame
-                        new_infections.append(np.int32(person[0]))
+
+        #sort sick people on x coordinate, so the sick within range of a healthy
+        #person on the x axis are a contiguous window that can be found by bisection
+        order = np.argsort(sick_previous_step[:,1])
+        xs = sick_previous_step[:,1][order]
+        ys = sick_previous_step[:,2][order]
+
+        for idx in healthy_idx:
+            #find window of sick people within infection range on x axis
+            lo = np.searchsorted(xs, population[idx][1] - infection_range, side='right')
+            hi = np.searchsorted(xs, population[idx][1] + infection_range, side='left')
+
+            #find infected nearby healthy person
+            poplen = np.count_nonzero(np.abs(ys[lo:hi] - population[idx][2]) < infection_range)
+
+            if poplen > 0:
+                if np.random.random() < (infection_chance * poplen):
+                    #roll die to see if healthy person will be infected
+                    population[idx][6] = 1
+                    population[idx][8] = frame
+                    new_infections.append(idx)
 
     if len(new_infections) > 0:
         print('at timestep %i these people got sick: %s' %(frame, new_infections))
@@ -236,39 +240,33 @@ def recover_or_die(population, frame, recovery_duration, mortality_chance):
 
     '''
 
-    #find sick people
-    sick_people = population[population[:,6] == 1]
+    #find sick people, the ID of each person is also their row in population
+    sick_idx = np.flatnonzero(population[:,6] == 1)
 
     #define vector of how long everyone has been sick
-    illness_duration_vector = frame - sick_people[:,8]
+    illness_duration_vector = frame - population[:,8][sick_idx]
     
-    recovery_odds_vector = (illness_duration_vector - recovery_duration[0]) / np.ptp(recovery_duration)
+    inv_recovery_range = 1.0 / (recovery_duration[1] - recovery_duration[0])
+    recovery_odds_vector = (illness_duration_vector - recovery_duration[0]) * inv_recovery_range
     recovery_odds_vector = np.clip(recovery_odds_vector, a_min = 0, a_max = None)
 
     #update states of sick people 
-    indices = sick_people[:,0][recovery_odds_vector >= sick_people[:,9]]
-
-    cured = []
-    died = []
+    indices = sick_idx[recovery_odds_vector >= population[:,9][sick_idx]]
 
     #decide whether to die or recover
-    for idx in indices:
-        if np.random.random() <= mortality_chance:
-            #die
-            sick_people[:,6][sick_people[:,0] == idx] = 3
-            died.append(np.int32(sick_people[sick_people[:,0] == idx][:,0][0]))
-        else:
-            #recover (become immune)
-            sick_people[:,6][sick_people[:,0] == idx] = 2
-            cured.append(np.int32(sick_people[sick_people[:,0] == idx][:,0][0]))
+    died_mask = np.random.random(len(indices)) <= mortality_chance
+    died = indices[died_mask]
+    cured = indices[~died_mask]
+
+    #die
+    population[:,6][died] = 3
+    #recover (become immune)
+    population[:,6][cured] = 2
 
     if len(died) > 0:
-        print('at timestep %i these people died: %s' %(frame, died))
+        print('at timestep %i these people died: %s' %(frame, died.tolist()))
     if len(cured) > 0:
-        print('at timestep %i these people recovered: %s' %(frame, cured))
-
-    #put array back into population
-    population[population[:,6] == 1] = sick_people
+        print('at timestep %i these people recovered: %s' %(frame, cured.tolist()))
 
     return population
 
@@ -5,14 +5,15 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
 from environment import build_hospital
-from infection import infect, recover_or_die, compute_mortality
+from infection import infect, recover_or_die, compute_mortality, set_seed
 from motion import update_positions, out_of_bounds, update_randoms,\
 set_destination, check_at_destination, keep_at_destination, get_motion_parameters
 from population import initialize_population, initialize_destination_matrix,\
-set_destination_bounds, save_data
+set_destination_bounds, save_data, get_state_counts
 
 #set seed for reproducibility
 np.random.seed(100)
+set_seed(100)
 
 def update(frame, population, destinations, pop_size, infection_range=0.01, 
            infection_chance=0.03, speed=0.01, recovery_duration=(200, 500), mortality_chance=0.02,
@@ -59,7 +60,7 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
         else:
             mx = np.max(infected_plot)
 
-        if len(population[population[:,6] == 1]) >= len(population) * lockdown_percentage or\
+        if get_state_counts(population)[1] >= len(population) * lockdown_percentage or\
            mx >= (len(population) * lockdown_percentage):
             #reduce speed of all members of society
             population[:,5] = np.clip(population[:,5], a_min = None, a_max = 0.001)
@@ -87,7 +88,7 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
                                       traveling_infects = traveling_infects)
    
 
-    infected_plot.append(len(population[population[:,6] == 1]))
+    infected_plot.append(get_state_counts(population)[1])
 
     #recover and die
     population = recover_or_die(population, frame, recovery_duration, mortality_chance,
@@ -98,7 +99,7 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
     #send cured back to population
     population[:,11][population[:,6] == 2] = 0
 
-    fatalities_plot.append(len(population[population[:,6] == 3]))
+    fatalities_plot.append(get_state_counts(population)[3])
 
     if visualise:
         #construct plot and visualise
@@ -287,28 +288,27 @@ if __name__ == '__main__':
                                 visualise, verbose, self_isolate, self_isolate_proportion,
                                 isolation_bounds, traveling_infects, lockdown, lockdown_percentage,
                                 lockdown_vector)
-            if len(population[population[:,6] == 1]) == 0 and i > 100:
+            healthy, infected, immune, dead = get_state_counts(population)
+            if infected == 0 and i > 100:
                 print('\n-----stopping-----\n')
-                print('total dead: %i' %len(population[population[:,6] == 3]))
-                print('total immune: %i' %len(population[population[:,6] == 2]))
+                print('total dead: %i' %dead)
+                print('total immune: %i' %immune)
                 if save_population:
                     save_data(population, infected_plot, fatalities_plot)
                 i = simulation_steps + 1
 
             sys.stdout.write('\r')
             sys.stdout.write('%i: healthy: %i, infected: %i, immune: %i, in treatment: %i, \
-dead: %i, of total: %i' %(i, len(population[population[:,6] == 0]),
-                          len(population[population[:,6] == 1]),
-                          len(population[population[:,6] == 2]), 
-                          len(population[population[:,10] == 1]),
-                          len(population[population[:,6] == 3]),
-                          pop_size))
+dead: %i, of total: %i' %(i, healthy, infected, immune,
+                          np.count_nonzero(population[:,10] == 1),
+                          dead, pop_size))
 
             i += 1
 
         print('\n-----stopping after all sick recovered or died-----\n')
-        print('total dead: %i' %len(population[population[:,6] == 3]))
-        print('total immune: %i' %len(population[population[:,6] == 2]))
+        healthy, infected, immune, dead = get_state_counts(population)
+        print('total dead: %i' %dead)
+        print('total immune: %i' %immune)
 
     if save_population:
         save_data(population, infected_plot, fatalities_plot)
\ No newline at end of file
@@ -10,7 +10,7 @@ healthcare_infection_correction
 from motion import update_positions, out_of_bounds, update_randoms,\
 set_destination, check_at_destination, keep_at_destination, get_motion_parameters
 from population import initialize_population, initialize_destination_matrix,\
-set_destination_bounds, save_data
+set_destination_bounds, save_data, get_state_counts
 
 
 def update(frame, population, destinations, pop_size, infection_range=0.01, 
@@ -65,10 +65,10 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
     #apply risk factor to healthcare worker pool
     if healthcare_worker_risk != 0: #if risk is not zero, affect workers
         workers = population[0:healthcare_workers]
-        workers = healthcare_infection_correction(workers, healthcare_worker_risk)
+        workers = healthcare_infection_correction(workers, frame, healthcare_worker_risk)
         population[0:healthcare_workers] = workers
 
-    infected_plot.append(len(population[population[:,6] == 1]))
+    infected_plot.append(get_state_counts(population)[1])
 
     #recover and die
     population = recover_or_die(population, frame, recovery_duration, mortality_chance,
@@ -79,7 +79,7 @@ def update(frame, population, destinations, pop_size, infection_range=0.01,
     #send cured back to population
     population[:,11][population[:,6] == 2] = 0
 
-    fatalities_plot.append(len(population[population[:,6] == 3]))
+    fatalities_plot.append(get_state_counts(population)[3])
 
     if visualise:
         #construct plot and visualise
@@ -275,25 +275,24 @@ if __name__ == '__main__':
                                 treatment_factor, healthcare_capacity, age_dependent_risk, 
                                 treatment_dependent_risk, visualise, verbose, healthcare_workers,
                                 healthcare_bounds, healthcare_worker_risk)
-            if len(population[population[:,6] == 1]) == 0 and i > 100:
+            healthy, infected, immune, dead = get_state_counts(population)
+            if infected == 0 and i > 100:
                 print('\n-----stopping-----\n')
-                print('total dead: %i' %len(population[population[:,6] == 3]))
-                print('total immune: %i' %len(population[population[:,6] == 2]))
+                print('total dead: %i' %dead)
+                print('total immune: %i' %immune)
                 if save_population:
                     save_data(population, infected_plot, fatalities_plot)
                 sys.exit(0)
             sys.stdout.write('\r')
             sys.stdout.write('%i: healthy: %i, infected: %i, immune: %i, in treatment: %i, \
-dead: %i, of total: %i' %(i, len(population[population[:,6] == 0]),
-                          len(population[population[:,6] == 1]),
-                          len(population[population[:,6] == 2]), 
-                          len(population[population[:,10] == 1]),
-                          len(population[population[:,6] == 3]),
-                          pop_size))
+dead: %i, of total: %i' %(i, healthy, infected, immune,
+                          np.count_nonzero(population[:,10] == 1),
+                          dead, pop_size))
 
         print('\n-----stopping after all infected recovered or died-----\n')
-        print('total dead: %i' %len(population[population[:,6] == 3]))
-        print('total immune: %i' %len(population[population[:,6] == 2]))
+        healthy, infected, immune, dead = get_state_counts(population)
+        print('total dead: %i' %dead)
+        print('total immune: %i' %immune)
 
     if save_population:
         save_data(population, infected_plot, fatalities_plot)
\ No newline at end of file